@@ -1,57 +1,135 @@
-def is_safe(board, row, col, n):
-    """Check if it's safe to place a queen at board[row][col]."""
-    for i in range(col):
-        if board[row][i] == 1:
-            return False
-    for i, j in zip(range(row, -1, -1), range(col, -1, -1)):
-        if board[i][j] == 1:
-            return False
-    for i, j in zip(range(row, n, 1), range(col, -1, -1)):
-        if board[i][j] == 1:
-            return False
-
-    return True
-
-def solve_nq_util(board, col, n, solutions):
-    if col >= n:
-        solution = []
-        for i in range(n):
-            row_str = ""
-            for j in range(n):
-                row_str += "Q " if board[i][j] == 1 else ". "
-            solution.append(row_str.strip())
-        solutions.append(solution)
-        return True 
+import multiprocessing
 
-    res = False
-    for i in range(n):
-        if is_safe(board, i, col, n):
-            board[i][col] = 1
-            res = solve_nq_util(board, col + 1, n, solutions) or res 
+# Below this board size, forking worker processes costs more than the
+# whole search; solve sequentially instead.
+PARALLEL_THRESHOLD = 12
+
+def solve_nq_util(row, cols, d1, d2, placement_cols, n, solutions):
+    """Bitmask DFS: place one queen per row, tracking attacks as three ints.
+
+    `cols`, `d1` and `d2` are bitmasks of the columns / falling diagonals /
+    rising diagonals attacked in the current row. A set bit in `free` is a
+    column where a queen can still go, so checking safety is a few integer
+    operations instead of an O(N) scan over a 2-D board.
 
-            board[i][col] = 0
+    Solutions are recorded as tuples of column indices (one per row);
+    stringifying a board is deferred to `format_solution`.
+    """
+    if row == n:
+        solutions.append(tuple(placement_cols))
+        return True
+
+    res = False
+    free = ((1 << n) - 1) & ~(cols | d1 | d2)
+    while free:
+        p = free & -free  # lowest set bit = next available column
+        free ^= p
+        res = solve_nq_util(row + 1, cols | p, (d1 | p) << 1, (d2 | p) >> 1,
+                            placement_cols + [p.bit_length() - 1], n, solutions) or res
 
     return res
 
-def solve_8_queens():
-    n = 8
-    board = [[0 for _ in range(n)] for _ in range(n)]
-    solutions = []
+def _count_util(row, cols, d1, d2, n):
+    """Counting twin of `solve_nq_util`: no placement list, just an int."""
+    if row == n:
+        return 1
+
+    count = 0
+    free = ((1 << n) - 1) & ~(cols | d1 | d2)
+    while free:
+        p = free & -free
+        free ^= p
+        count += _count_util(row + 1, cols | p, (d1 | p) << 1, (d2 | p) >> 1, n)
+
+    return count
+
+def _count_from_first_col(first_col, n):
+    """Counts solutions whose row-0 queen sits in `first_col`."""
+    p = 1 << first_col
+    return _count_util(1, p, p << 1, p >> 1, n)
+
+def solve_nqueens_count(n):
+    """Returns only the number of solutions for an n-queens board.
+
+    For large boards the per-solution bookkeeping of the enumerating DFS
+    (placement lists, mirroring, eventual board strings) dominates; when
+    only the count matters this path just increments an integer at each
+    leaf, with the same mirror-symmetry reduction on the first row.
+    """
+    first_cols = range((n + 1) // 2)
+    if n >= PARALLEL_THRESHOLD:
+        with multiprocessing.Pool() as pool:
+            counts = pool.starmap(_count_from_first_col,
+                                  [(first_col, n) for first_col in first_cols])
+    else:
+        counts = [_count_from_first_col(first_col, n) for first_col in first_cols]
 
-    solve_nq_util(board, 0, n, solutions)
+    total = 0
+    for first_col, count in zip(first_cols, counts):
+        if n % 2 == 1 and first_col == n // 2:
+            total += count
+        else:
+            total += 2 * count
+    return total
+
+def format_solution(placement_cols, n):
+    """Render a solution (tuple of column indices) as a list of board rows."""
+    return [" ".join("Q" if j == c else "." for j in range(n)) for c in placement_cols]
+
+def _solve_from_first_col(first_col, n):
+    """Enumerates every solution whose row-0 queen sits in `first_col`.
+
+    The subtrees under different first-row columns are independent, which
+    makes this the natural unit of work for parallel search.
+    """
+    p = 1 << first_col
+    branch = []
+    solve_nq_util(1, p, p << 1, p >> 1, [first_col], n, branch)
+    return branch
+
+def solve_nqueens_enum(n):
+    # Solutions come in mirror pairs (reflection about the vertical axis),
+    # so only explore first-row columns in the left half and reflect each
+    # solution found. For odd n the centre column maps to itself under the
+    # reflection, so its subtree already contains both members of each pair
+    # and must not be mirrored again.
+    first_cols = range((n + 1) // 2)
+
+    # The first-row subtrees are embarrassingly parallel; farm them out to
+    # one worker per column once the board is big enough to pay for the
+    # process pool.
+    if n >= PARALLEL_THRESHOLD:
+        with multiprocessing.Pool() as pool:
+            branches = pool.starmap(_solve_from_first_col,
+                                    [(first_col, n) for first_col in first_cols])
+    else:
+        branches = [_solve_from_first_col(first_col, n) for first_col in first_cols]
+
+    solutions = []
+    for first_col, branch in zip(first_cols, branches):
+        solutions.extend(branch)
+        if not (n % 2 == 1 and first_col == n // 2):
+            solutions.extend(tuple(n - 1 - c for c in sol) for sol in branch)
 
     if not solutions:
         print("Solution does not exist")
         return []
 
-  
+
     return solutions
 
+def solve_8_queens():
+    return solve_nqueens_enum(8)
+
 if __name__ == "__main__":
-    all_solutions = solve_8_queens()
-    if all_solutions:
-        print(f"Found {len(all_solutions)} solutions for the 8-Queen problem.")
+    total = solve_nqueens_count(8)
+    if total:
+        print(f"Found {total} solutions for the 8-Queen problem.")
         print("Showing the first solution as an example:")
-        for row_str in all_solutions[0]:
+        # Only one board is displayed, so enumerate a single first-row
+        # subtree rather than materializing all solutions.
+        example = _solve_from_first_col(0, 8)[0]
+        for row_str in format_solution(example, 8):
             print(row_str)
-
+    else:
+        print("Solution does not exist")
@@ -5,23 +5,36 @@ The problem: Three missionaries and three cannibals are on one side of a river,
 along with a boat that can hold one or two people. Find a way to get everyone
 to the other side, without ever leaving a group of missionaries in one place
 outnumbered by the cannibals in that place.
-"""
 
-from collections import deque
+Invariant: frontiers are expanded level by level as plain lists (never
+popped from the front, which would shift every remaining entry), and
+their entries stay small (bare state codes), never whole paths.
+"""
 
 # N represents the number of missionaries and cannibals (default is 3)
 N_PERSONS = 3
 BOAT_CAPACITY = 2
 
 class State:
+    # Slots avoid a per-instance __dict__: states shrink severalfold and
+    # attribute access in hashing/equality gets faster. The right-bank
+    # counts are derived, so they are properties rather than stored slots.
+    __slots__ = ('ml', 'cl', 'bl')
+
     def __init__(self, missionaries_left, cannibals_left, boat_on_left_bank):
         self.ml = missionaries_left  # Missionaries on the left bank
         self.cl = cannibals_left    # Cannibals on the left bank
         self.bl = boat_on_left_bank # 1 if boat is on left bank, 0 if on right bank
 
-        # Missionaries and cannibals on the right bank are derived
-        self.mr = N_PERSONS - self.ml
-        self.cr = N_PERSONS - self.cl
+    @property
+    def mr(self):
+        # Missionaries on the right bank are derived
+        return N_PERSONS - self.ml
+
+    @property
+    def cr(self):
+        # Cannibals on the right bank are derived
+        return N_PERSONS - self.cl
 
     def is_valid(self):
         # Check if missionaries are outnumbered on the left bank
@@ -47,56 +60,155 @@ class State:
     def __str__(self):
         return f"(M_L={self.ml}, C_L={self.cl}, Boat_L={self.bl} | M_R={self.mr}, C_R={self.cr})"
 
+# The boat loads and their action descriptions are the same for every state,
+# so build them once at import instead of on every successor expansion.
+POSSIBLE_MOVES = [(m_boat, c_boat) # (missionaries_in_boat, cannibals_in_boat)
+                  for m_boat in range(BOAT_CAPACITY + 1)
+                  for c_boat in range(BOAT_CAPACITY + 1)
+                  if 1 <= m_boat + c_boat <= BOAT_CAPACITY]
+ACTION_L2R = {move: f"Move {move[0]}M, {move[1]}C from Left to Right"
+              for move in POSSIBLE_MOVES}
+ACTION_R2L = {move: f"Move {move[0]}M, {move[1]}C from Right to Left"
+              for move in POSSIBLE_MOVES}
+
 def get_possible_next_states(current_state):
     """Generates all valid successor states from the current state."""
     next_states = []
-    possible_moves = [] # (missionaries_in_boat, cannibals_in_boat)
-    for m_boat in range(BOAT_CAPACITY + 1):
-        for c_boat in range(BOAT_CAPACITY + 1):
-            if 1 <= m_boat + c_boat <= BOAT_CAPACITY:
-                possible_moves.append((m_boat, c_boat))
-
-    for m_moved, c_moved in possible_moves:
+    for move in POSSIBLE_MOVES:
+        m_moved, c_moved = move
         if current_state.bl == 1: # Boat is on the left bank, moving to right
             if current_state.ml >= m_moved and current_state.cl >= c_moved:
-                new_state = State(current_state.ml - m_moved, 
-                                  current_state.cl - c_moved, 
+                new_state = State(current_state.ml - m_moved,
+                                  current_state.cl - c_moved,
                                   0)
-                action_description = f"Move {m_moved}M, {c_moved}C from Left to Right"
                 if new_state.is_valid():
-                    next_states.append((new_state, action_description))
+                    next_states.append((new_state, ACTION_L2R[move]))
         else: # Boat is on the right bank, moving to left
             if current_state.mr >= m_moved and current_state.cr >= c_moved:
-                new_state = State(current_state.ml + m_moved, 
-                                  current_state.cl + c_moved, 
+                new_state = State(current_state.ml + m_moved,
+                                  current_state.cl + c_moved,
                                   1)
-                action_description = f"Move {m_moved}M, {c_moved}C from Right to Left"
                 if new_state.is_valid():
-                    next_states.append((new_state, action_description))
+                    next_states.append((new_state, ACTION_R2L[move]))
     return next_states
 
+# --- Integer-coded search space -------------------------------------------
+# The BFS inner loop never needs State objects: each state is encoded as a
+# small int, so the visited check is one bytearray index instead of hashing
+# a State, and the successor list per code is built exactly once at import.
+
+NUM_CODES = (N_PERSONS + 1) ** 2 * 2
+
+def encode_state(ml, cl, bl):
+    """Packs (missionaries_left, cannibals_left, boat_left) into one int."""
+    return (ml * (N_PERSONS + 1) + cl) * 2 + bl
+
+def decode_state(code):
+    """Rebuilds the State object for a code (only used to report the path)."""
+    ml_cl, bl = divmod(code, 2)
+    ml, cl = divmod(ml_cl, N_PERSONS + 1)
+    return State(ml, cl, bl)
+
+def _build_transition_table():
+    """Precomputes, for every valid coded state, its (action, successor) list."""
+    table = [[] for _ in range(NUM_CODES)]
+    for ml in range(N_PERSONS + 1):
+        for cl in range(N_PERSONS + 1):
+            for bl in (0, 1):
+                state = State(ml, cl, bl)
+                if state.is_valid():
+                    table[encode_state(ml, cl, bl)] = [
+                        (action, encode_state(next_s.ml, next_s.cl, next_s.bl))
+                        for next_s, action in get_possible_next_states(state)
+                    ]
+    return table
+
+TRANSITIONS = _build_transition_table()
+
+def _invert_direction(action):
+    """Maps a crossing to the crossing that undoes it (same load, other way)."""
+    if action.endswith("Left to Right"):
+        return action.replace("Left to Right", "Right to Left")
+    return action.replace("Right to Left", "Left to Right")
+
 def solve_missionaries_cannibals():
-    """Solves the Missionaries and Cannibals problem using BFS."""
+    """Solves the Missionaries and Cannibals problem using bidirectional BFS.
+
+    Two frontiers expand level by level, one from the initial state and one
+    from the goal, always growing the smaller frontier first; the search
+    stops as soon as a state appears in both parent maps. Every boat
+    crossing is reversible, so the goal-side frontier reuses the forward
+    TRANSITIONS table and just swaps the action's direction. Each side
+    explores roughly half the depth of a one-directional BFS, so the
+    visited set shrinks accordingly (noticeable if N_PERSONS is scaled up).
+    Paths are rebuilt from the two parent maps only once, at the meeting
+    state; queue entries stay bare codes throughout.
+    """
     initial_state = State(N_PERSONS, N_PERSONS, 1)
     if not initial_state.is_valid():
         return "Initial state is invalid!"
 
-    queue = deque([(initial_state, [])]) # Each item is (state, path_to_state_with_actions)
-    visited = {initial_state}
+    initial = encode_state(N_PERSONS, N_PERSONS, 1)
+    goal = encode_state(0, 0, 0)
+    if initial == goal:
+        return [("Goal Reached", decode_state(goal))]
+
+    parents_fwd = {initial: None} # code -> (previous_code, action) towards initial
+    parents_bwd = {goal: None}    # code -> (next_code, action) towards goal
+    frontier_fwd = [initial]
+    frontier_bwd = [goal]
+    meeting_code = None
+
+    while frontier_fwd and frontier_bwd and meeting_code is None:
+        if len(frontier_fwd) <= len(frontier_bwd):
+            next_frontier = []
+            for current_code in frontier_fwd:
+                for action, next_code in TRANSITIONS[current_code]:
+                    if next_code not in parents_fwd:
+                        parents_fwd[next_code] = (current_code, action)
+                        next_frontier.append(next_code)
+                        if next_code in parents_bwd:
+                            meeting_code = next_code
+                            break
+                if meeting_code is not None:
+                    break
+            frontier_fwd = next_frontier
+        else:
+            next_frontier = []
+            for current_code in frontier_bwd:
+                # Predecessors of a state are its successors with the
+                # crossing reversed.
+                for action, previous_code in TRANSITIONS[current_code]:
+                    if previous_code not in parents_bwd:
+                        parents_bwd[previous_code] = (current_code, _invert_direction(action))
+                        next_frontier.append(previous_code)
+                        if previous_code in parents_fwd:
+                            meeting_code = previous_code
+                            break
+                if meeting_code is not None:
+                    break
+            frontier_bwd = next_frontier
+
+    if meeting_code is None:
+        return "No solution found."
 
-    while queue:
-        current_state, path = queue.popleft()
+    # Splice the two half-paths together at the meeting state.
+    path = []
+    current_code = meeting_code
+    while parents_fwd[current_code] is not None:
+        previous_code, action = parents_fwd[current_code]
+        path.append((action, decode_state(previous_code))) # Store action and state before action
+        current_code = previous_code
+    path.reverse()
 
-        if current_state.is_goal():
-            return path + [("Goal Reached", current_state)]
+    current_code = meeting_code
+    while parents_bwd[current_code] is not None:
+        next_code, action = parents_bwd[current_code]
+        path.append((action, decode_state(current_code)))
+        current_code = next_code
 
-        for next_s, action in get_possible_next_states(current_state):
-            if next_s not in visited:
-                visited.add(next_s)
-                new_path = path + [(action, current_state)] # Store action and state before action
-                queue.append((next_s, new_path))
-    
-    return "No solution found."
+    path.append(("Goal Reached", decode_state(goal)))
+    return path
 
 if __name__ == "__main__":
     print(f"Solving Missionaries and Cannibals Problem for {N_PERSONS} pairs with boat capacity {BOAT_CAPACITY}:\n")
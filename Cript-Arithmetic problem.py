@@ -10,6 +10,149 @@ Example: SEND + MORE = MONEY
 
 import itertools
 
+import numpy as np
+
+# Permutations are evaluated in NumPy batches of this size; see
+# solve_cryptarithmetic_brute_force.
+PERMUTATION_BATCH_SIZE = 100_000
+
+def _parse_puzzle(puzzle_str):
+    """Normalizes and validates a puzzle string.
+
+    Returns:
+        tuple: (operand_words, result_word, error). On success `error` is
+               None; on a malformed puzzle the words are None and `error`
+               holds the message to show the caller.
+    """
+    puzzle_str = puzzle_str.replace(" ", "").upper()
+    if puzzle_str.count("=") != 1:
+        return None, None, "Invalid puzzle format: Must contain exactly one '=' sign."
+
+    left_side, right_side = puzzle_str.split("=")
+    if not right_side:
+        return None, None, "Invalid puzzle format: Result part cannot be empty."
+
+    operand_words = left_side.split("+")
+    if not all(operand_words) or not operand_words:
+        return None, None, "Invalid puzzle format: Operand parts cannot be empty."
+
+    unique_letters = set(left_side) | set(right_side)
+    unique_letters.discard("+")
+    if len(unique_letters) > 10:
+        return None, None, (f"Invalid puzzle: Too many unique letters ({len(unique_letters)}). "
+                            "Only 10 digits (0-9) are available.")
+
+    return operand_words, right_side, None
+
+def _format_solution(letter_to_digit_map, operand_words, result_word):
+    """Formats a found assignment the way the solvers report it."""
+    solution_map_str = ", ".join(f"{k}={v}" for k, v in sorted(letter_to_digit_map.items()))
+
+    operand_values = [int("".join(str(letter_to_digit_map[char]) for char in word))
+                      for word in operand_words]
+    result_value = int("".join(str(letter_to_digit_map[char]) for char in result_word))
+
+    num_operands_str = " + ".join(str(val) for val in operand_values)
+    return f"Solution: {{ {solution_map_str} }} -> {num_operands_str} = {result_value}"
+
+def _puzzle_coefficients(operand_words, result_word, unique_letters):
+    """Compiles the equation into one net positional weight per letter.
+
+    `SEND` contributes S:1000, E:100, N:10, D:1; result letters contribute
+    negatively. An assignment solves the puzzle exactly when the dot
+    product of these coefficients with the digit vector is zero, so a
+    candidate can be tested with a handful of integer multiplies instead
+    of building every word as a string and converting it to int.
+    """
+    index = {letter: i for i, letter in enumerate(unique_letters)}
+    coefficients = [0] * len(unique_letters)
+    for word in operand_words:
+        for pos, letter in enumerate(word):
+            coefficients[index[letter]] += 10 ** (len(word) - 1 - pos)
+    for pos, letter in enumerate(result_word):
+        coefficients[index[letter]] -= 10 ** (len(result_word) - 1 - pos)
+    return coefficients
+
+def solve_cryptarithmetic_brute_force(puzzle_str):
+    """
+    Solves a cryptarithmetic puzzle by trying digit permutations.
+
+    Kept as an independent cross-check for `solve_cryptarithmetic`.
+    The leading letter of the result is assigned first from its narrow
+    domain (when the result out-lengths every operand, that digit is
+    exactly the final carry, which is below the number of addends), and
+    only the remaining letters are permuted. Permutations are pulled from
+    `itertools.permutations` in batches of `PERMUTATION_BATCH_SIZE` and
+    laid out as a (B, L) int8 array, so each batch is scored with one
+    matrix-vector product against the precompiled letter coefficients
+    (see `_puzzle_coefficients`) instead of evaluating candidates one at
+    a time in the interpreter. The column-wise solver remains the one to
+    use for hard puzzles.
+    """
+    try:
+        operand_words, result_word, error = _parse_puzzle(puzzle_str)
+        if error:
+            return error
+        all_words = operand_words + [result_word]
+
+        unique_letters = sorted(set("".join(all_words)))
+        coefficients = _puzzle_coefficients(operand_words, result_word, unique_letters)
+
+        lead_letter = result_word[0]
+        if len(result_word) > max(len(word) for word in operand_words):
+            # The lead digit is the carry out of the top column, and adding
+            # k numbers below 10^m cannot carry k or more.
+            lead_domain = range(1, min(10, len(operand_words)))
+        elif len(result_word) > 1:
+            lead_domain = range(1, 10)
+        else:
+            lead_domain = range(10)
+
+        other_letters = [letter for letter in unique_letters if letter != lead_letter]
+        num_others = len(other_letters)
+        lead_coefficient = coefficients[unique_letters.index(lead_letter)]
+        other_coefficients = np.asarray(
+            [coefficients[unique_letters.index(letter)] for letter in other_letters],
+            dtype=np.int64)
+        leading_indices = np.array(
+            [i for i, letter in enumerate(other_letters)
+             if any(len(word) > 1 and word[0] == letter for word in all_words)],
+            dtype=np.intp)
+
+        for lead_digit in lead_domain:
+            if not other_letters:
+                if lead_digit * lead_coefficient == 0:
+                    return _format_solution({lead_letter: lead_digit},
+                                            operand_words, result_word)
+                continue
+
+            remaining_digits = [d for d in range(10) if d != lead_digit]
+            permutations = itertools.permutations(remaining_digits, num_others)
+            while True:
+                flat = np.fromiter(
+                    itertools.chain.from_iterable(
+                        itertools.islice(permutations, PERMUTATION_BATCH_SIZE)),
+                    dtype=np.int8)
+                if flat.size == 0:
+                    break
+                batch = flat.reshape(-1, num_others)
+
+                # One matmul scores the whole batch; only exact hits are
+                # re-validated against the leading-zero constraint.
+                hits = np.nonzero(
+                    batch @ other_coefficients + lead_digit * lead_coefficient == 0)[0]
+                for hit in hits:
+                    candidate = batch[hit]
+                    if leading_indices.size and (candidate[leading_indices] == 0).any():
+                        continue
+                    letter_to_digit_map = dict(zip(other_letters, (int(d) for d in candidate)))
+                    letter_to_digit_map[lead_letter] = lead_digit
+                    return _format_solution(letter_to_digit_map, operand_words, result_word)
+
+        return "No solution found."
+    except Exception as e:
+        return f"An unexpected error occurred: {str(e)}"
+
 def solve_cryptarithmetic(puzzle_str):
     """
     Solves a cryptarithmetic puzzle.
@@ -24,71 +167,80 @@ def solve_cryptarithmetic(puzzle_str):
              or a message indicating no solution was found or if the puzzle is invalid.
     """
     try:
-        # Normalize and parse the puzzle string
-        puzzle_str = puzzle_str.replace(" ", "").upper()
-        if puzzle_str.count("=") != 1:
-            return "Invalid puzzle format: Must contain exactly one '=' sign."
-
-        left_side, right_side = puzzle_str.split("=")
-        if not right_side:
-            return "Invalid puzzle format: Result part cannot be empty."
-        
-        operand_words = left_side.split("+")
-        if not all(operand_words) or not operand_words:
-             return "Invalid puzzle format: Operand parts cannot be empty."
-
-        result_word = right_side
+        operand_words, result_word, error = _parse_puzzle(puzzle_str)
+        if error:
+            return error
         all_words = operand_words + [result_word]
 
-        # Collect unique letters
-        unique_letters = sorted(list(set("".join(all_words))))
-
-        if len(unique_letters) > 10:
-            return f"Invalid puzzle: Too many unique letters ({len(unique_letters)}). Only 10 digits (0-9) are available."
-
         # Identify leading letters of multi-digit numbers (cannot be zero)
         first_letters_of_multi_digit_words = set()
         for word in all_words:
             if len(word) > 1:
                 first_letters_of_multi_digit_words.add(word[0])
 
-        digits = range(10)
-        
-        # Try all permutations of digits for the unique letters
-        for p in itertools.permutations(digits, len(unique_letters)):
-            letter_to_digit_map = dict(zip(unique_letters, p))
-            
-            # Constraint: Leading letters of multi-digit numbers cannot be zero
-            has_leading_zero_issue = False
-            for first_letter in first_letters_of_multi_digit_words:
-                if letter_to_digit_map[first_letter] == 0:
-                    has_leading_zero_issue = True
-                    break
-            if has_leading_zero_issue:
-                continue
+        # Solve column by column with carry propagation, like grade-school
+        # addition: assign digits only to the letters of the current column,
+        # check that the column sum (plus carry) matches the result letter,
+        # and backtrack as soon as a column is inconsistent. This prunes the
+        # search by orders of magnitude compared with trying full
+        # permutations of all letters and converting every word to int.
+        num_columns = max(len(word) for word in all_words)
+        # column 0 is the units column; words are right-aligned
+        column_letters = [[word[-1 - c] for word in operand_words if c < len(word)]
+                          for c in range(num_columns)]
+        result_letters = [result_word[-1 - c] if c < len(result_word) else None
+                          for c in range(num_columns)]
+
+        letter_to_digit_map = {}
+        used_digits = [False] * 10
+
+        def solve_column(c, carry):
+            if c == num_columns:
+                return carry == 0
+            return place_operands(c, 0, carry, 0)
+
+        def place_operands(c, idx, carry, column_sum):
+            letters = column_letters[c]
+            if idx == len(letters):
+                total = column_sum + carry
+                digit, carry_out = total % 10, total // 10
+                result_letter = result_letters[c]
+                if result_letter is None:
+                    # Result is shorter than this column; nothing may spill over.
+                    return digit == 0 and solve_column(c + 1, carry_out)
+                bound = letter_to_digit_map.get(result_letter)
+                if bound is not None:
+                    return bound == digit and solve_column(c + 1, carry_out)
+                if used_digits[digit]:
+                    return False
+                if digit == 0 and result_letter in first_letters_of_multi_digit_words:
+                    return False
+                letter_to_digit_map[result_letter] = digit
+                used_digits[digit] = True
+                if solve_column(c + 1, carry_out):
+                    return True
+                del letter_to_digit_map[result_letter]
+                used_digits[digit] = False
+                return False
+
+            letter = letters[idx]
+            bound = letter_to_digit_map.get(letter)
+            if bound is not None:
+                return place_operands(c, idx + 1, carry, column_sum + bound)
+            first_digit = 1 if letter in first_letters_of_multi_digit_words else 0
+            for digit in range(first_digit, 10):
+                if not used_digits[digit]:
+                    letter_to_digit_map[letter] = digit
+                    used_digits[digit] = True
+                    if place_operands(c, idx + 1, carry, column_sum + digit):
+                        return True
+                    del letter_to_digit_map[letter]
+                    used_digits[digit] = False
+            return False
+
+        if solve_column(0, 0):
+            return _format_solution(letter_to_digit_map, operand_words, result_word)
 
-            # Convert words to numbers using the current mapping
-            try:
-                operand_values = []
-                for word in operand_words:
-                    num_str = "".join(str(letter_to_digit_map[char]) for char in word)
-                    operand_values.append(int(num_str))
-                
-                result_str = "".join(str(letter_to_digit_map[char]) for char in result_word)
-                result_value = int(result_str)
-
-                # Check if the arithmetic equation holds
-                if sum(operand_values) == result_value:
-                    # Format the solution string
-                    solution_map_str = ", ".join(f"{k}={v}" for k, v in sorted(letter_to_digit_map.items()))
-                    
-                    num_operands_str = " + ".join(str(val) for val in operand_values)
-                    equation_with_numbers = f"{num_operands_str} = {result_value}"
-                    
-                    return f"Solution: {{ {solution_map_str} }} -> {equation_with_numbers}"
-            except ValueError: # Should not happen if logic is correct, but as a safeguard
-                continue
-                
         return "No solution found."
     except Exception as e:
         return f"An unexpected error occurred: {str(e)}"
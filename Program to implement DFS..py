@@ -3,20 +3,132 @@ This program implements the Depth-First Search (DFS) algorithm.
 DFS is an algorithm for traversing or searching tree or graph data structures.
 The algorithm starts at the root node (selecting some arbitrary node as the root node in the case of a graph)
 and explores as far as possible along each branch before backtracking.
+
+Invariant: the DFS stack is a plain list touched only with append() and
+pop(), both O(1) at the tail. Never use pop(0) here — popping from the
+front shifts the entire list on every step.
 """
 
-def dfs_recursive(graph, node, visited, dfs_order):
-    """Recursive helper function for DFS."""
-    visited.add(node)
-    dfs_order.append(node)
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the pure-Python CSR loop still works
+    njit = None
+
+def compile_graph(graph):
+    """
+    Interns node labels to contiguous integer ids and packs the adjacency
+    list into CSR (compressed sparse row) form.
+
+    The neighbors of node id `u` are `indices[indptr[u]:indptr[u + 1]]`,
+    kept in their original adjacency-list order. Traversals over the CSR
+    arrays index into flat int32 buffers instead of hashing arbitrary node
+    labels; compile once and reuse for repeated traversals of the same graph.
+
+    Args:
+        graph (dict): A dictionary representing the graph as an adjacency list.
+
+    Returns:
+        tuple: (node_to_id, id_to_node, indptr, indices) where node_to_id
+               maps labels to ids, id_to_node is the inverse list, and
+               indptr/indices are numpy int32 CSR arrays.
+    """
+    id_to_node = list(graph)
+    seen = set(id_to_node)
+    for neighbors in graph.values():
+        for neighbor in neighbors:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                id_to_node.append(neighbor)
+    node_to_id = {label: node_id for node_id, label in enumerate(id_to_node)}
+
+    indptr = np.zeros(len(id_to_node) + 1, dtype=np.int32)
+    flat_indices = []
+    for node_id, label in enumerate(id_to_node):
+        for neighbor in graph.get(label, []):
+            flat_indices.append(node_to_id[neighbor])
+        indptr[node_id + 1] = len(flat_indices)
+    indices = np.asarray(flat_indices, dtype=np.int32)
+
+    return node_to_id, id_to_node, indptr, indices
+
+if njit is not None:
+    @njit(cache=True)
+    def _dfs_csr(indptr, indices, start):
+        """JIT-compiled iterative DFS inner loop over flat int32 arrays."""
+        num_nodes = indptr.shape[0] - 1
+        visited = np.zeros(num_nodes, np.uint8)
+        order = np.empty(num_nodes, np.int32)
+        # A node can sit on the stack once per incoming edge, so size by edges.
+        stack = np.empty(indices.shape[0] + 1, np.int32)
+        filled = 0
+        top = 0
+
+        stack[top] = start
+        top += 1
+
+        while top > 0:
+            top -= 1
+            u = stack[top]
+            if visited[u] == 0:
+                visited[u] = 1
+                order[filled] = u
+                filled += 1
+                for k in range(indptr[u + 1] - 1, indptr[u] - 1, -1):
+                    v = indices[k]
+                    if visited[v] == 0:
+                        stack[top] = v
+                        top += 1
+
+        return order[:filled]
+
+def dfs_fast(indptr, indices, start):
+    """
+    Performs iterative DFS over a compiled CSR graph (see `compile_graph`).
+
+    Neighbors are pushed in reverse CSR order so nodes are visited in the
+    same order as the label-based traversal. When numba is installed the
+    traversal runs in the JIT-compiled `_dfs_csr` kernel; otherwise a
+    pure-Python loop over the same arrays is used.
+
+    Args:
+        indptr, indices: CSR adjacency arrays from `compile_graph`.
+        start (int): Id of the node to start from.
+
+    Returns:
+        list: Node ids in the order they were visited.
+    """
+    if njit is not None:
+        return _dfs_csr(indptr, indices, start).tolist()
+
+    num_nodes = len(indptr) - 1
+    visited = bytearray(num_nodes)  # one byte per node beats set() hashing
+    stack = [start]
+    dfs_order = []
 
-    for neighbor in graph.get(node, []):
-        if neighbor not in visited:
-            dfs_recursive(graph, neighbor, visited, dfs_order)
+    while stack:
+        u = stack.pop()
+        if not visited[u]:
+            visited[u] = 1
+            dfs_order.append(u)
+            for k in range(indptr[u + 1] - 1, indptr[u] - 1, -1):
+                v = indices[k]
+                if not visited[v]:
+                    stack.append(v)
+
+    return dfs_order
 
 def dfs(graph, start_node):
     """
-    Performs Depth-First Search on a graph using a recursive approach.
+    Performs Depth-First Search on a graph.
+
+    This used to recurse one Python frame per node, which pays frame and
+    argument-tuple allocation on every visit and hits the interpreter's
+    recursion limit on chain-like graphs of ~1000 nodes. It now simply
+    delegates to `dfs_iterative`, whose explicit stack has neither cost;
+    neighbors are pushed in reverse so the visit order stays the standard
+    left-to-right DFS order.
 
     Args:
         graph (dict): A dictionary representing the graph as an adjacency list.
@@ -27,21 +139,17 @@ def dfs(graph, start_node):
         list: A list of nodes in the order they were visited (one possible DFS order).
               Returns an empty list if the start_node is not in the graph.
     """
-    if start_node not in graph:
-        print(f"Error: Start node '{start_node}' not found in the graph.")
-        return []
-
-    visited = set()  # To keep track of visited nodes
-    dfs_order = []   # To store the order of visited nodes
-    
-    dfs_recursive(graph, start_node, visited, dfs_order)
-    
-    return dfs_order
+    return dfs_iterative(graph, start_node)
 
 def dfs_iterative(graph, start_node):
     """
     Performs Depth-First Search on a graph using an iterative approach (with a stack).
 
+    Convenience wrapper: compiles the graph to CSR form, runs `dfs_fast`,
+    and translates the visited ids back to node labels. Callers that
+    traverse the same graph many times should call `compile_graph` once
+    and use `dfs_fast` directly.
+
     Args:
         graph (dict): A dictionary representing the graph as an adjacency list.
         start_node: The node from which to start the DFS traversal.
@@ -54,23 +162,9 @@ def dfs_iterative(graph, start_node):
         print(f"Error: Start node '{start_node}' not found in the graph.")
         return []
 
-    visited = set()
-    stack = [start_node] # Use a list as a stack
-    dfs_order = []
-
-    while stack:
-        node = stack.pop() # Pop the last element (LIFO)
-
-        if node not in visited:
-            visited.add(node)
-            dfs_order.append(node)
-
-            # Add neighbors to the stack in reverse order to visit them in standard order
-            # (e.g., if neighbors are [B, C], add C then B, so B is processed first)
-            for neighbor in reversed(graph.get(node, [])):
-                if neighbor not in visited:
-                    stack.append(neighbor)
-    return dfs_order
+    node_to_id, id_to_node, indptr, indices = compile_graph(graph)
+    order_ids = dfs_fast(indptr, indices, node_to_id[start_node])
+    return [id_to_node[node_id] for node_id in order_ids]
 
 
 if __name__ == "__main__":
@@ -5,17 +5,423 @@ that visits each city exactly once and returns to the origin city.
 
 Note: The brute-force approach has a time complexity of O(n!), where n is
 the number of cities. This makes it impractical for a large number of cities.
-For more than a small number of cities (e.g., >10-12), more advanced algorithms
-like dynamic programming (Held-Karp), branch and bound, or heuristics
-(e.g., nearest neighbor, genetic algorithms, simulated annealing) are required.
+For more than 10 cities, `solve_tsp_brute_force` therefore switches to the
+Held-Karp dynamic program (O(n^2 * 2^n)), which is still exact but turns
+instances like n=13 from unreachable into seconds. For even larger n,
+heuristics (e.g., nearest neighbor, genetic algorithms, simulated annealing)
+are required.
 """
 
+import functools
 import itertools
 import math
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    from scipy.spatial.distance import pdist, squareform
+except ImportError:  # scipy is optional; NumPy broadcasting covers the build
+    pdist = squareform = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; NumPy fallbacks stay in place
+    njit = prange = None
+
+# Above this size the factorial permutation loop is hopeless and the
+# Held-Karp dynamic program takes over.
+BRUTE_FORCE_LIMIT = 10
+
+# Up to this size the fully vectorized permutation scan beats the pruned
+# DFS: (n-1)! stays small enough that one NumPy gather-sum over all tours
+# is cheaper than interpreting the branch-and-bound recursion.
+VECTORIZED_LIMIT = 8
+
+# Past this size even the exact Held-Karp DP (O(n^2 * 2^n)) stops being
+# practical, and `solve_tsp` switches to heuristic search.
+EXACT_LIMIT = 20
 
 def calculate_distance(point1, point2):
-    """Calculates the Euclidean distance between two points (cities)."""
-    return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
+    """Calculates the Euclidean distance between two points (cities).
+
+    math.hypot evaluates the whole expression in one C call — no
+    intermediate Python-level squaring or sqrt — and stays accurate for
+    extreme coordinate magnitudes where dx*dx would overflow.
+    """
+    return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
+
+def _build_distance_matrix(cities):
+    """Builds the full Euclidean distance matrix from city coordinates.
+
+    scipy's pdist computes each of the n*(n-1)/2 unique pairs once in a
+    C SIMD loop and squareform mirrors them into the full matrix; without
+    scipy, a NumPy broadcast does the same work in one kernel. Either way
+    there are no n^2 Python-level calculate_distance calls.
+
+    `cities` may be the caller's list of coordinate tuples or an already
+    converted (n, 2) array; either way the work happens on one contiguous
+    float64 block, not on boxed Python floats.
+
+    Note: distances stay in the true Euclidean domain. Comparing tours by
+    sums of *squared* edge lengths would be cheaper but is not
+    order-preserving for sums, so it would change the argmin.
+    """
+    pts = np.ascontiguousarray(cities, dtype=np.float64)
+    if pdist is not None:
+        return squareform(pdist(pts))
+    diff = pts[:, None, :] - pts[None, :, :]
+    return np.sqrt((diff * diff).sum(-1))
+
+@functools.lru_cache(maxsize=8)
+def _dist_matrix(coords_tuple):
+    """Cached front-end to `_build_distance_matrix`, keyed by coordinates.
+
+    Re-solving over the same coordinate set (parameter sweeps, comparing
+    solvers on one instance) hits the cache instead of rebuilding the
+    O(n^2) matrix; only the most recent few coordinate sets are kept.
+    The key must be a tuple of coordinate tuples so it is hashable, and
+    callers must treat the returned matrix as read-only — it is shared
+    between cache hits.
+    """
+    return _build_distance_matrix(coords_tuple)
+
+if njit is not None:
+    @njit(cache=True)
+    def _tour_cost(D, perm):
+        """Length of the closed tour visiting `perm` in order.
+
+        The accumulator starts from the closing edge rather than a float
+        literal so it inherits D's dtype: integral matrices sum with
+        exact int64 adds, float matrices as before.
+        """
+        total = D[perm[perm.shape[0] - 1], perm[0]]
+        for k in range(perm.shape[0] - 1):
+            total += D[perm[k], perm[k + 1]]
+        return total
+
+    @njit(cache=True)
+    def _brute_force_jit(D):
+        """Exhaustive JIT-compiled tour scan with a single reused buffer.
+
+        Generates the orderings of cities 1..n-1 with Heap's algorithm
+        (city 0 stays fixed at the front): each successive permutation
+        differs from the previous one by a single swap inside the same
+        int32 buffer, so stepping is O(1) with no allocation — versus
+        the O(n) suffix scan and reversal that lexicographic stepping
+        pays per candidate. Every permutation is scored with `_tour_cost`.
+        """
+        n = D.shape[0]
+        perm = np.empty(n, np.int32)
+        for i in range(n):
+            perm[i] = i
+        best_cost = _tour_cost(D, perm)
+        best_perm = perm.copy()
+
+        m = n - 1 # length of the permuted tail, which starts at index 1
+        counters = np.zeros(m, np.int32)
+        i = 0
+        while i < m:
+            if counters[i] < i:
+                if i % 2 == 0:
+                    perm[1], perm[1 + i] = perm[1 + i], perm[1]
+                else:
+                    j = 1 + counters[i]
+                    perm[j], perm[1 + i] = perm[1 + i], perm[j]
+
+                cost = _tour_cost(D, perm)
+                if cost < best_cost:
+                    best_cost = cost
+                    best_perm[:] = perm
+
+                counters[i] += 1
+                i = 0
+            else:
+                counters[i] = 0
+                i += 1
+
+        return best_cost, best_perm
+
+    @njit(cache=True, parallel=True)
+    def _brute_force_jit_parallel(D):
+        """Exhaustive scan split across threads by the tour's second city.
+
+        Tours from city 0 partition cleanly by their second stop, so
+        prange hands each of the n-1 subtrees to a thread; each thread
+        runs the same Heap's-algorithm enumeration as `_brute_force_jit`
+        over the remaining n-2 cities in its own buffer, and the parent
+        keeps the cheapest of the per-thread winners.
+        """
+        n = D.shape[0]
+        best_costs = np.empty(n - 1, D.dtype)
+        best_perms = np.empty((n - 1, n), np.int32)
+
+        for t in prange(n - 1):
+            second = t + 1
+            perm = np.empty(n, np.int32)
+            perm[0] = 0
+            perm[1] = second
+            k = 2
+            for c in range(1, n):
+                if c != second:
+                    perm[k] = c
+                    k += 1
+            best_cost = _tour_cost(D, perm)
+            best_perm = perm.copy()
+
+            m = n - 2 # length of the permuted tail, which starts at index 2
+            counters = np.zeros(m, np.int32)
+            i = 0
+            while i < m:
+                if counters[i] < i:
+                    if i % 2 == 0:
+                        perm[2], perm[2 + i] = perm[2 + i], perm[2]
+                    else:
+                        j = 2 + counters[i]
+                        perm[j], perm[2 + i] = perm[2 + i], perm[j]
+
+                    cost = _tour_cost(D, perm)
+                    if cost < best_cost:
+                        best_cost = cost
+                        best_perm[:] = perm
+
+                    counters[i] += 1
+                    i = 0
+                else:
+                    counters[i] = 0
+                    i += 1
+
+            best_costs[t] = best_cost
+            best_perms[t] = best_perm
+
+        winner = np.argmin(best_costs)
+        return best_costs[winner], best_perms[winner]
+
+# _brute_force_vectorized drains the permutation iterator in batches of
+# this many tours once materializing all of them would stop fitting in
+# memory; see the function for the small-n single-batch fast path.
+PERMUTATION_CHUNK = 200_000
+
+def _brute_force_vectorized(adj_matrix, num_cities):
+    """Scores every tour from city 0 with NumPy gathers instead of a loop.
+
+    The (n-1)! orderings of the remaining cities are laid out as int8 rows
+    (city indices fit in a byte, so four times as many tours per cache
+    line as int32), city 0 is prepended, and every tour length is computed
+    by a single fancy-indexed gather of consecutive edge costs followed by
+    a row sum — no per-permutation Python work at all. Up to n=10 all rows
+    are materialized at once (9! * 9 bytes is ~3 MB); beyond that, one
+    array would run to gigabytes, so the iterator is drained in
+    PERMUTATION_CHUNK-row batches and only the running best survives,
+    keeping memory flat while each batch still gets the one-gather scoring.
+
+    Returns:
+        tuple: (min_distance, best_path_indices) with the tour starting and
+               ending at city 0.
+    """
+    D = np.asarray(adj_matrix)
+    tail_iter = itertools.permutations(range(1, num_cities))
+    batch_rows = (math.factorial(num_cities - 1) if num_cities <= 10
+                  else PERMUTATION_CHUNK)
+
+    min_distance = float("inf")
+    best_path_indices = []
+    while True:
+        flat = np.fromiter(
+            itertools.chain.from_iterable(itertools.islice(tail_iter, batch_rows)),
+            dtype=np.int8)
+        if flat.size == 0:
+            break
+        tails = flat.reshape(-1, num_cities - 1)
+        tours = np.concatenate(
+            [np.zeros((len(tails), 1), dtype=np.int8), tails], axis=1)
+
+        costs = D[tours[:, :-1], tours[:, 1:]].sum(axis=1) + D[tours[:, -1], 0]
+        best = int(np.argmin(costs))
+        if costs[best] < min_distance:
+            # .item() unboxes to a plain int or float matching D's dtype.
+            min_distance = costs[best].item()
+            best_path_indices = [int(i) for i in tours[best]] + [0]
+
+    return min_distance, best_path_indices
+
+def _nearest_neighbor_tour(adj_matrix, num_cities):
+    """Greedy tour from city 0: always hop to the nearest unvisited city.
+
+    Not optimal, but O(n^2) and usually within a few percent of optimal,
+    which makes it a tight initial upper bound for `_branch_and_bound`:
+    most subtrees are then cut at their very first edge instead of only
+    once the DFS has stumbled on a good tour by itself.
+
+    Returns:
+        tuple: (cost, path_indices) for the closed greedy tour.
+    """
+    visited = [False] * num_cities
+    visited[0] = True
+    path = [0]
+    cost = 0.0
+    last = 0
+    for _ in range(num_cities - 1):
+        nxt = min((j for j in range(num_cities) if not visited[j]),
+                  key=lambda j: adj_matrix[last][j])
+        cost += adj_matrix[last][nxt]
+        visited[nxt] = True
+        path.append(nxt)
+        last = nxt
+    return cost + adj_matrix[last][0], path + [0]
+
+def _branch_and_bound(adj_matrix, num_cities, second_city=None):
+    """Exact branch-and-bound DFS over tours starting at city 0.
+
+    Extends the path one city at a time and abandons any branch whose cost
+    already reaches the best complete tour; candidate cities are tried
+    nearest-first so improvements are found early, and the bound is seeded
+    with the nearest-neighbor tour so pruning bites from the first branch.
+    When `second_city` is given, only tours whose second stop is that city
+    are explored — the unit of work used to split the search across
+    processes.
+
+    Returns:
+        tuple: (min_distance, best_path_indices). If the restricted subtree
+               holds nothing better, this is the nearest-neighbor seed
+               tour, which is still a valid upper bound for the caller's
+               min-reduction.
+    """
+    city_indices = list(range(num_cities))
+    by_nearest = [sorted(city_indices, key=lambda j, i=i: adj_matrix[i][j])
+                  for i in range(num_cities)]
+
+    min_distance, best_path_indices = _nearest_neighbor_tour(adj_matrix, num_cities)
+    visited = [False] * num_cities
+    visited[0] = True
+    path = [0]
+
+    def dfs(last, cost):
+        nonlocal min_distance, best_path_indices
+        if cost >= min_distance:
+            return
+        if len(path) == num_cities:
+            total = cost + adj_matrix[last][0]
+            if total < min_distance:
+                min_distance = total
+                best_path_indices = path + [0]
+            return
+        for nxt in by_nearest[last]:
+            if not visited[nxt]:
+                visited[nxt] = True
+                path.append(nxt)
+                dfs(nxt, cost + adj_matrix[last][nxt])
+                path.pop()
+                visited[nxt] = False
+
+    if second_city is None:
+        dfs(0, 0)
+    else:
+        visited[second_city] = True
+        path.append(second_city)
+        dfs(second_city, adj_matrix[0][second_city])
+
+    return min_distance, best_path_indices
+
+def _branch_and_bound_shared(shm_name, shape, dtype, num_cities, second_city):
+    """Pool worker: attach to the shared distance matrix, search one subtree.
+
+    The parent puts the matrix in a SharedMemory block once; each worker
+    maps it zero-copy instead of receiving its own pickled n x n copy
+    with every task.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        adj_matrix = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        return _branch_and_bound(adj_matrix, num_cities, second_city)
+    finally:
+        shm.close()
+
+if njit is not None:
+    @njit(cache=True)
+    def _held_karp_relax(adj_matrix):
+        """JIT-compiled Held-Karp relaxation: plain loops at C speed."""
+        n = adj_matrix.shape[0]
+        full = 1 << n
+        dp = np.full((full, n), np.inf)
+        parent = np.full((full, n), -1, dtype=np.int32)
+        dp[1, 0] = 0.0
+
+        for mask in range(1, full, 2):  # city 0 is always part of the path
+            for i in range(n):
+                if (mask >> i) & 1 == 0:
+                    continue
+                base = dp[mask, i]
+                if base == np.inf:
+                    continue
+                for j in range(n):
+                    if (mask >> j) & 1:
+                        continue
+                    next_mask = mask | (1 << j)
+                    candidate = base + adj_matrix[i, j]
+                    if candidate < dp[next_mask, j]:
+                        dp[next_mask, j] = candidate
+                        parent[next_mask, j] = i
+
+        return dp, parent
+
+def _held_karp(adj_matrix):
+    """Solves TSP exactly with the Held-Karp bitmask dynamic program.
+
+    dp[mask][i] is the cost of the cheapest path that starts at city 0,
+    visits exactly the cities in `mask`, and ends at city i. Each mask is
+    relaxed towards all cities outside it; a parent table records the
+    predecessor so the optimal tour can be reconstructed. The relaxation
+    runs in the numba kernel `_held_karp_relax` when available, otherwise
+    in NumPy with the updates vectorized per (mask, endpoint).
+
+    Args:
+        adj_matrix (np.ndarray): (n, n) matrix of pairwise distances.
+
+    Returns:
+        tuple: (min_distance, best_path_indices) with the tour starting and
+               ending at city 0.
+    """
+    n = len(adj_matrix)
+    full = 1 << n
+
+    if njit is not None:
+        dp, parent = _held_karp_relax(adj_matrix)
+    else:
+        dp = np.full((full, n), np.inf)
+        parent = np.full((full, n), -1, dtype=np.int32)
+        dp[1, 0] = 0.0
+
+        all_cities = np.arange(n, dtype=np.int32)
+        for mask in range(1, full, 2):  # city 0 is always part of the path
+            in_mask = (mask >> all_cities) & 1 == 1
+            free = all_cities[~in_mask]
+            if free.size == 0:
+                continue
+            next_masks = mask | (1 << free)
+            for i in all_cities[in_mask]:
+                base = dp[mask, i]
+                if base == np.inf:
+                    continue
+                candidates = base + adj_matrix[i, free]
+                better = candidates < dp[next_masks, free]
+                if better.any():
+                    dp[next_masks[better], free[better]] = candidates[better]
+                    parent[next_masks[better], free[better]] = i
+
+    # Close the tour: cheapest endpoint plus the edge back to city 0.
+    closing = dp[full - 1] + adj_matrix[:, 0]
+    last = int(np.argmin(closing[1:])) + 1
+    min_distance = float(closing[last])
+
+    path = [0]
+    mask, i = full - 1, last
+    while i != 0:
+        path.append(i)
+        mask, i = mask ^ (1 << i), int(parent[mask, i])
+    path.reverse()
+    return min_distance, path + [0]
 
 def solve_tsp_brute_force(cities, distance_matrix=None):
     """
@@ -42,54 +448,180 @@ def solve_tsp_brute_force(cities, distance_matrix=None):
              return 0, [0,0]
         return float("inf"), []
 
-    # If distance_matrix is not provided, create one from city coordinates
+    # If distance_matrix is not provided, create one from city coordinates.
+    # The cached build converts the coordinates once into a contiguous
+    # (n, 2) float64 array and does all the work on raw doubles; repeat
+    # solves on the same coordinates reuse the finished matrix. Only the
+    # returned path maps indices back to the caller's original tuples.
     if distance_matrix is None:
-        adj_matrix = [[0] * num_cities for _ in range(num_cities)]
-        for i in range(num_cities):
-            for j in range(num_cities):
-                if i != j:
-                    adj_matrix[i][j] = calculate_distance(cities[i], cities[j])
-        city_indices = list(range(num_cities))
+        adj_matrix = _dist_matrix(tuple(map(tuple, cities)))
     else:
-        adj_matrix = distance_matrix
-        city_indices = list(range(num_cities)) # Assume cities are indexed 0 to n-1
+        # Assume cities are indexed 0 to n-1. Integral matrices stay in
+        # int64: tour costs then accumulate with exact single-instruction
+        # adds and come back as plain ints, not floats.
+        adj_matrix = np.asarray(distance_matrix)
+        if not np.issubdtype(adj_matrix.dtype, np.integer):
+            adj_matrix = adj_matrix.astype(np.float64)
 
-    # Start from the first city (index 0)
-    start_city_index = city_indices[0]
-    other_city_indices = city_indices[1:]
+    # Beyond the brute-force horizon, fall back to the exact Held-Karp DP.
+    if num_cities > BRUTE_FORCE_LIMIT:
+        min_distance, best_path_indices = _held_karp(np.asarray(adj_matrix, dtype=np.float64))
+    elif njit is not None:
+        # The JIT-compiled scan beats both interpreter-side strategies for
+        # every brute-force size.
+        min_distance, best_perm = _brute_force_jit(np.asarray(adj_matrix))
+        best_path_indices = [int(i) for i in best_perm] + [0]
+    elif num_cities > VECTORIZED_LIMIT:
+        min_distance, best_path_indices = _branch_and_bound(adj_matrix, num_cities)
+    else:
+        min_distance, best_path_indices = _brute_force_vectorized(adj_matrix, num_cities)
 
-    min_distance = float("inf")
-    best_path_indices = []
+    # If using coordinates, map indices back to city coordinates for the
+    # path with one fancy-indexed gather. The gather runs over an object
+    # array holding the caller's own tuples: a float64 round trip would
+    # rewrite integer coordinates as floats on the way out.
+    if distance_matrix is None:
+        coords = np.empty(len(cities), dtype=object)
+        coords[:] = cities
+        return min_distance, coords[best_path_indices].tolist()
+    else:
+        return min_distance, best_path_indices
+
+def _path_cost(adj_matrix, path):
+    """Sums the edges of `path` over the matrix, unboxing numpy scalars."""
+    total = 0
+    for k in range(len(path) - 1):
+        total += adj_matrix[path[k]][path[k + 1]]
+    return total.item() if isinstance(total, np.generic) else total
+
+def _two_opt(adj_matrix, path):
+    """Improves a closed tour in place with 2-opt moves until none helps.
+
+    Whenever replacing edges (a,b) and (c,d) with (a,c) and (b,d) would
+    shorten the tour, the segment between b and c is reversed. Each full
+    pass is O(n^2) and passes repeat until a local optimum; started from
+    a nearest-neighbor tour this typically lands within a few percent of
+    optimal on geometric instances.
+    """
+    n = len(path) - 1 # path closes back to its first city
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            for j in range(i + 1, n):
+                a, b = path[i - 1], path[i]
+                c, d = path[j], path[j + 1]
+                if adj_matrix[a][c] + adj_matrix[b][d] < adj_matrix[a][b] + adj_matrix[c][d]:
+                    path[i:j + 1] = path[j:i - 1:-1]
+                    improved = True
+    return path
+
+def solve_tsp(cities, distance_matrix=None, exact=None):
+    """Size-based TSP front door: exact where affordable, heuristic beyond.
+
+    Up to EXACT_LIMIT cities (or whenever `exact=True`) this defers to
+    `solve_tsp_brute_force`, which already escalates internally from the
+    permutation scans to Held-Karp. Past the limit (or with
+    `exact=False`) the instance goes to the LKH solver via the optional
+    `elkai` package when it is installed, and otherwise to a
+    nearest-neighbor tour polished by 2-opt — not guaranteed optimal,
+    but typically within a couple of percent, at polynomial cost.
+
+    Args:
+        cities, distance_matrix: As for `solve_tsp_brute_force`.
+        exact (bool, optional): Force the exact (True) or heuristic
+            (False) route; None picks by instance size.
+
+    Returns:
+        tuple: (distance, path), same shape as `solve_tsp_brute_force`.
+    """
+    num_cities = len(cities)
+    if exact or (exact is None and num_cities <= EXACT_LIMIT) or num_cities < 2:
+        return solve_tsp_brute_force(cities, distance_matrix)
+
+    if distance_matrix is None:
+        adj_matrix = _dist_matrix(tuple(map(tuple, cities)))
+    else:
+        adj_matrix = np.asarray(distance_matrix)
+        if not np.issubdtype(adj_matrix.dtype, np.integer):
+            adj_matrix = adj_matrix.astype(np.float64)
+
+    try:
+        import elkai
+    except ImportError: # optional; the local heuristic below covers it
+        elkai = None
+
+    if elkai is not None:
+        tour = elkai.solve_float_matrix(
+            np.asarray(adj_matrix, dtype=np.float64).tolist())
+        best_path_indices = [int(i) for i in tour] + [0]
+    else:
+        _, best_path_indices = _nearest_neighbor_tour(adj_matrix, num_cities)
+        best_path_indices = _two_opt(adj_matrix, best_path_indices)
+    min_distance = _path_cost(adj_matrix, best_path_indices)
 
-    # Generate all permutations of other cities
-    for perm in itertools.permutations(other_city_indices):
-        current_path_distance = 0
-        current_path_indices = [start_city_index] + list(perm)
+    if distance_matrix is None:
+        coords = np.empty(len(cities), dtype=object)
+        coords[:] = cities
+        return min_distance, coords[best_path_indices].tolist()
+    return min_distance, best_path_indices
 
-        # Calculate distance for the current path
-        # From start_city to the first city in permutation
-        current_distance = adj_matrix[start_city_index][perm[0]]
-        current_path_distance += current_distance
+def solve_tsp_brute_force_parallel(cities, distance_matrix=None, processes=None):
+    """
+    Exact TSP search split across worker processes.
 
-        # Distances between cities in the permutation
-        for i in range(len(perm) - 1):
-            current_distance = adj_matrix[perm[i]][perm[i+1]]
-            current_path_distance += current_distance
+    Tours from city 0 partition cleanly by their second stop. With numba
+    installed the n-1 subtrees run on threads inside the prange kernel
+    `_brute_force_jit_parallel`; otherwise each subtree is handed to a
+    pool worker that runs the branch-and-bound DFS restricted to it, and
+    the parent keeps the cheapest result. Worthwhile once the sequential
+    search takes longer than starting the workers (roughly n >= 9); tiny
+    instances and Held-Karp sized ones are simply delegated to
+    `solve_tsp_brute_force`.
 
-        # Distance from the last city in permutation back to the start_city
-        current_distance = adj_matrix[perm[-1]][start_city_index]
-        current_path_distance += current_distance
+    Args:
+        cities, distance_matrix: As for `solve_tsp_brute_force`.
+        processes (int, optional): Pool size for the process-pool
+            fallback; the numba kernel uses its own thread count.
 
-        if current_path_distance < min_distance:
-            min_distance = current_path_distance
-            best_path_indices = current_path_indices + [start_city_index] # Add return to start
+    Returns:
+        tuple: (min_distance, best_path), same as `solve_tsp_brute_force`.
+    """
+    num_cities = len(cities)
+    if num_cities < 4 or num_cities > BRUTE_FORCE_LIMIT:
+        return solve_tsp_brute_force(cities, distance_matrix)
 
-    # If using coordinates, map indices back to city coordinates for the path
     if distance_matrix is None:
-        best_path_coords = [cities[i] for i in best_path_indices]
-        return min_distance, best_path_coords
+        adj_matrix = _dist_matrix(tuple(map(tuple, cities)))
     else:
-        return min_distance, best_path_indices
+        adj_matrix = np.asarray(distance_matrix)
+        if not np.issubdtype(adj_matrix.dtype, np.integer):
+            adj_matrix = adj_matrix.astype(np.float64)
+
+    if njit is not None:
+        min_distance, best_perm = _brute_force_jit_parallel(np.asarray(adj_matrix))
+        best_path_indices = [int(i) for i in best_perm] + [0]
+    else:
+        # Stage the matrix in shared memory so the pool tasks carry only
+        # its name and shape instead of a pickled n x n array each.
+        D = np.ascontiguousarray(adj_matrix)
+        shm = shared_memory.SharedMemory(create=True, size=D.nbytes)
+        try:
+            np.ndarray(D.shape, dtype=D.dtype, buffer=shm.buf)[:] = D
+            with multiprocessing.Pool(processes) as pool:
+                results = pool.starmap(_branch_and_bound_shared,
+                                       [(shm.name, D.shape, D.dtype, num_cities, second_city)
+                                        for second_city in range(1, num_cities)])
+        finally:
+            shm.close()
+            shm.unlink()
+        min_distance, best_path_indices = min(results, key=lambda result: result[0])
+
+    if distance_matrix is None:
+        coords = np.empty(len(cities), dtype=object)
+        coords[:] = cities
+        return min_distance, coords[best_path_indices].tolist()
+    return min_distance, best_path_indices
 
 if __name__ == "__main__":
     # Example 1: Using city coordinates
@@ -167,5 +699,14 @@ if __name__ == "__main__":
         print(f"Best path (coordinates): {best_p_5}")
     else:
         print("Could not find a solution.")
+    print("-"*40)
+
+    # Example 5: Beyond the exact horizon, solve_tsp routes to heuristics
+    # (LKH when elkai is installed, nearest-neighbor + 2-opt otherwise).
+    print("Example 5: 30 Cities via solve_tsp (heuristic for large n)")
+    rng = np.random.default_rng(0)
+    big_cities = [tuple(point) for point in rng.uniform(0, 100, size=(30, 2))]
+    min_dist_big, best_p_big = solve_tsp(big_cities)
+    print(f"Heuristic tour length for 30 cities: {min_dist_big:.2f}")
 
 
@@ -21,56 +21,122 @@ Agent Logic (Simple Reflex Agent):
 - If both rooms are clean, NO_OP.
 """
 
-import random
+from enum import IntEnum
+
+import numpy as np
+
+class Action(IntEnum):
+    """Action ids; the names double as the legacy string protocol."""
+    SUCK = 0
+    MOVE_TO_A = 1
+    MOVE_TO_B = 2
+    NO_OP = 3
+
+# Rooms and statuses indexed by the internal int encoding: the agent's
+# location is 0 (Room A) or 1 (Room B), and a room's status is the bit
+# for that room in the dirt byte.
+_ROOM_NAMES = ("A", "B")
+_STATUS_NAMES = ("Clean", "Dirty")
 
 class VacuumEnvironment:
-    def __init__(self, room_a_status="Dirty", room_b_status="Dirty"):
+    """Two-room vacuum world with constant-time action dispatch.
+
+    The state is two machine ints — a dirt byte (bit 0 = Room A dirty,
+    bit 1 = Room B dirty) and a location index — and `step` dispatches
+    through a tuple of handlers indexed by action id instead of an
+    if/elif chain of string comparisons. Per-step printing is gated on
+    `verbose` so batch simulations pay no I/O; the original string-based
+    API (`rooms`, `agent_location`, string actions) is kept as thin
+    views over the int state.
+    """
+
+    def __init__(self, room_a_status="Dirty", room_b_status="Dirty", verbose=True,
+                 seed=None):
         # Possible statuses: "Clean", "Dirty"
-        self.rooms = {
-            "A": room_a_status,
-            "B": room_b_status
-        }
-        self.agent_location = random.choice(["A", "B"])
+        # `seed` may be an int for a reproducible run, None for a fresh
+        # stream, or an existing np.random.Generator so that sweeps over
+        # many environments can share one RNG instead of constructing
+        # one per trial.
+        self._dirty = (room_a_status == "Dirty") | ((room_b_status == "Dirty") << 1)
+        self._rng = np.random.default_rng(seed)
+        self._location = int(self._rng.integers(0, 2))
         self.performance_score = 0
-        print(f"Initial Environment: Room A is {self.rooms['A']}, Room B is {self.rooms['B']}. Agent starts in Room {self.agent_location}.")
+        self.verbose = verbose
+        if self.verbose:
+            rooms = self.rooms
+            print(f"Initial Environment: Room A is {rooms['A']}, Room B is {rooms['B']}. Agent starts in Room {self.agent_location}.")
+
+    @property
+    def rooms(self):
+        """Dict view of the dirt byte, for the original string API."""
+        return {"A": _STATUS_NAMES[self._dirty & 1],
+                "B": _STATUS_NAMES[(self._dirty >> 1) & 1]}
+
+    @property
+    def agent_location(self):
+        return _ROOM_NAMES[self._location]
 
     def get_percept(self):
-        return (self.agent_location, self.rooms[self.agent_location])
+        return (_ROOM_NAMES[self._location],
+                _STATUS_NAMES[(self._dirty >> self._location) & 1])
 
     def is_dirty(self, room):
-        return self.rooms[room] == "Dirty"
+        return bool((self._dirty >> _ROOM_NAMES.index(room)) & 1)
 
     def all_clean(self):
-        return self.rooms["A"] == "Clean" and self.rooms["B"] == "Clean"
+        return self._dirty == 0
+
+    def _do_suck(self):
+        bit = 1 << self._location
+        if self._dirty & bit:
+            self._dirty &= ~bit
+            self.performance_score += 10 # Reward for cleaning
+            if self.verbose:
+                print(f"Action: SUCK. Room {self.agent_location} is now Clean. Score: {self.performance_score}")
+        elif self.verbose:
+            print(f"Action: SUCK (but Room {self.agent_location} was already Clean). Score: {self.performance_score}")
+
+    def _do_move_to_a(self):
+        if self._location == 1:
+            self._location = 0
+            if self.verbose:
+                print(f"Action: MOVE_TO_A. Agent is now in Room A. Score: {self.performance_score}")
+        elif self.verbose:
+            print(f"Action: MOVE_TO_A (but agent already in Room A). Score: {self.performance_score}")
+
+    def _do_move_to_b(self):
+        if self._location == 0:
+            self._location = 1
+            if self.verbose:
+                print(f"Action: MOVE_TO_B. Agent is now in Room B. Score: {self.performance_score}")
+        elif self.verbose:
+            print(f"Action: MOVE_TO_B (but agent already in Room B). Score: {self.performance_score}")
+
+    def _do_no_op(self):
+        if self.verbose:
+            print(f"Action: NO_OP. Environment is clean. Score: {self.performance_score}")
+
+    # Handler table indexed by Action id: dispatch is one tuple load
+    # instead of a chain of string comparisons.
+    _handlers = (_do_suck, _do_move_to_a, _do_move_to_b, _do_no_op)
 
     def step(self, action):
+        """Applies one action, given as an `Action` or its string name."""
         self.performance_score -= 1 # Cost for each action/time step
 
-        if action == "SUCK":
-            if self.rooms[self.agent_location] == "Dirty":
-                self.rooms[self.agent_location] = "Clean"
-                self.performance_score += 10 # Reward for cleaning
-                print(f"Action: SUCK. Room {self.agent_location} is now Clean. Score: {self.performance_score}")
-            else:
-                print(f"Action: SUCK (but Room {self.agent_location} was already Clean). Score: {self.performance_score}")
-        elif action == "MOVE_TO_A":
-            if self.agent_location == "B":
-                self.agent_location = "A"
-                print(f"Action: MOVE_TO_A. Agent is now in Room A. Score: {self.performance_score}")
-            else:
-                print(f"Action: MOVE_TO_A (but agent already in Room A). Score: {self.performance_score}")
-        elif action == "MOVE_TO_B":
-            if self.agent_location == "A":
-                self.agent_location = "B"
-                print(f"Action: MOVE_TO_B. Agent is now in Room B. Score: {self.performance_score}")
-            else:
-                print(f"Action: MOVE_TO_B (but agent already in Room B). Score: {self.performance_score}")
-        elif action == "NO_OP":
-             print(f"Action: NO_OP. Environment is clean. Score: {self.performance_score}")
-        else:
-            print(f"Action: {action} (Unknown action). Score: {self.performance_score}")
-        
-        print(f"Current State: Room A: {self.rooms['A']}, Room B: {self.rooms['B']}, Agent in: {self.agent_location}")
+        if isinstance(action, str):
+            try:
+                action = Action[action]
+            except KeyError:
+                if self.verbose:
+                    print(f"Action: {action} (Unknown action). Score: {self.performance_score}")
+                action = None
+        if action is not None:
+            self._handlers[action](self)
+
+        if self.verbose:
+            rooms = self.rooms
+            print(f"Current State: Room A: {rooms['A']}, Room B: {rooms['B']}, Agent in: {self.agent_location}")
         return self.get_percept()
 
 class ReflexVacuumAgent:
@@ -80,19 +146,66 @@ class ReflexVacuumAgent:
     def get_action(self, percept):
         location, status = percept
         if status == "Dirty":
-            return "SUCK"
+            return Action.SUCK
         elif location == "A":
-            return "MOVE_TO_B"
+            return Action.MOVE_TO_B
         elif location == "B":
-            return "MOVE_TO_A"
-        return "NO_OP" # Should not be reached if logic is correct and env not all clean
-
+            return Action.MOVE_TO_A
+        return Action.NO_OP # Should not be reached if logic is correct and env not all clean
+
+
+def simulate_reflex_batch(num_episodes, max_steps=10, seed=None):
+    """Runs many reflex-agent episodes in lockstep as NumPy state vectors.
+
+    Instead of one VacuumEnvironment object per episode stepped in a
+    Python loop, the whole batch is held structure-of-arrays style —
+    `loc`, `a_dirty`, `b_dirty`, `score`, one entry per episode — and
+    each step updates every episode with a handful of whole-array mask
+    operations. The per-episode semantics match the scalar environment
+    driven by ReflexVacuumAgent: every action costs 1, a successful SUCK
+    earns 10, and an episode stops acting once both rooms are clean
+    (no trailing NO_OP).
+
+    Args:
+        num_episodes (int): Number of random initial conditions to draw.
+        max_steps (int): Step cap per episode, as in the scalar demo.
+        seed: Anything np.random.default_rng accepts.
+
+    Returns:
+        np.ndarray: int32 performance score per episode.
+    """
+    rng = np.random.default_rng(seed)
+    loc = rng.integers(0, 2, size=num_episodes, dtype=np.int8)
+    a_dirty = rng.integers(0, 2, size=num_episodes).astype(bool)
+    b_dirty = rng.integers(0, 2, size=num_episodes).astype(bool)
+    score = np.zeros(num_episodes, dtype=np.int32)
+
+    for _ in range(max_steps):
+        active = a_dirty | b_dirty
+        if not active.any():
+            break
+        score -= active # step cost, only while the episode is running
+        in_a = loc == 0
+        # The reflex rule: SUCK where the current room is dirty,
+        # otherwise move to the other room.
+        suck = active & np.where(in_a, a_dirty, b_dirty)
+        a_dirty &= ~(suck & in_a)
+        b_dirty &= ~(suck & ~in_a)
+        score += 10 * suck
+        move = active & ~suck
+        loc = np.where(move, 1 - loc, loc)
+
+    return score
 
 if __name__ == "__main__":
-    # Initialize environment with random initial states for rooms
-    initial_room_a = random.choice(["Clean", "Dirty"])
-    initial_room_b = random.choice(["Clean", "Dirty"])
-    env = VacuumEnvironment(room_a_status=initial_room_a, room_b_status=initial_room_b)
+    # Initialize environment with random initial states for rooms; one
+    # Generator drives the whole run (both dirt draws in a single batched
+    # call, plus the start location inside the environment).
+    rng = np.random.default_rng()
+    initial_room_a, initial_room_b = (
+        "Dirty" if dirty else "Clean" for dirty in rng.integers(0, 2, size=2))
+    env = VacuumEnvironment(room_a_status=initial_room_a, room_b_status=initial_room_b,
+                            seed=rng)
     agent = ReflexVacuumAgent()
 
     max_steps = 10 # Prevent infinite loops for simple agents
@@ -102,17 +215,21 @@ if __name__ == "__main__":
             print(f"\nEnvironment is clean after {i} steps.")
             env.step("NO_OP") # One final NO_OP to reflect clean state
             break
-        
+
         print(f"\nStep {i + 1}")
         current_percept = env.get_percept()
         print(f"Agent Percept: {current_percept}")
         action = agent.get_action(current_percept)
         env.step(action)
-    
+
     if not env.all_clean() and i == max_steps -1:
         print(f"\nSimulation ended after {max_steps} steps. Environment may not be fully clean.")
-    
+
     print(f"\nFinal Performance Score: {env.performance_score}")
     print(f"Final State: Room A: {env.rooms['A']}, Room B: {env.rooms['B']}, Agent in: {env.agent_location}")
 
+    # Batched evaluation: many random episodes stepped in lockstep.
+    batch_scores = simulate_reflex_batch(10_000, seed=0)
+    print(f"\nBatch evaluation: mean score over {batch_scores.size} random episodes: {batch_scores.mean():.2f}")
+
 
@@ -1,35 +1,126 @@
-from collections import deque
+"""
+Solves the Water Jug problem with Breadth-First Search.
+
+Invariant: the BFS frontier is a preallocated int32 array consumed by
+advancing a head index, which is O(1) per dequeue. Never replace it
+with a plain list and pop(0), which shifts the whole list on every
+dequeue. Every state is enqueued at most once, so a buffer of
+(C1+1)*(C2+1) slots can never overflow.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the plain-Python transitions stay in place
+    njit = None
+
+# Action descriptions indexed by move id; `_successors` writes the move
+# outcomes in this same order, so pairing a successor with its label is
+# one tuple load instead of rebuilding six (state, string) tuples per
+# dequeued state.
+ACTIONS = ("Fill Jug1", "Fill Jug2", "Empty Jug1", "Empty Jug2",
+           "Pour Jug1 to Jug2", "Pour Jug2 to Jug1")
+
+# Gates the step-by-step listing in the demo below (the solver itself
+# never prints). Flip to False for batch timing runs, where a print per
+# step would dominate the actual search time.
+VERBOSE = True
+
+def _successors(code, jug1_capacity, jug2_capacity, out):
+    """Writes the packed successor codes of `code` into `out`, one per move.
+
+    The transition function is pure for a given pair of capacities, so it
+    lives outside the BFS loop and fills a preallocated buffer instead of
+    building a fresh list of tuples on every dequeue. Compiled with numba
+    when available.
+    """
+    width = jug2_capacity + 1
+    j1 = code // width
+    j2 = code - j1 * width
+    out[0] = jug1_capacity * width + j2 # Fill Jug1
+    out[1] = j1 * width + jug2_capacity # Fill Jug2
+    out[2] = j2                         # Empty Jug1
+    out[3] = j1 * width                 # Empty Jug2
+    pour = min(j1, jug2_capacity - j2)
+    out[4] = (j1 - pour) * width + (j2 + pour) # Pour Jug1 to Jug2
+    pour = min(j2, jug1_capacity - j1)
+    out[5] = (j1 + pour) * width + (j2 - pour) # Pour Jug2 to Jug1
+
+if njit is not None:
+    _successors = njit(cache=True)(_successors)
+
+def _bfs_parents(jug1_capacity, jug2_capacity, target_amount):
+    """Runs the whole BFS over packed state codes in flat int arrays.
+
+    The frontier is a preallocated int32 array driven by head/tail
+    indices — 4 bytes per slot, no PyObject pointers, and since every
+    state is enqueued at most once a buffer of one slot per code can
+    never overflow. Visited flags and the parent links are equally flat,
+    so with numba installed the entire search loop compiles to machine
+    code; without it the same function runs unchanged in Python.
+
+    Returns:
+        tuple: (goal_code, parent_code, parent_move), goal_code being -1
+               if the target is unreachable. parent_move holds indices
+               into ACTIONS; decoding to states and labels happens in
+               the caller.
+    """
+    width = jug2_capacity + 1
+    num_codes = (jug1_capacity + 1) * width
+    visited = np.zeros(num_codes, np.uint8)
+    parent_code = np.full(num_codes, -1, np.int32)
+    parent_move = np.full(num_codes, -1, np.int8)
+    queue = np.empty(num_codes, np.int32)
+    successor_codes = np.empty(6, np.int64)
+
+    queue[0] = 0 # (0, 0) packs to 0
+    visited[0] = 1
+    head, tail = 0, 1
+
+    while head < tail:
+        code = queue[head]
+        head += 1
+        j1 = code // width
+        j2 = code - j1 * width
+        if j1 == target_amount or j2 == target_amount:
+            return code, parent_code, parent_move
+        _successors(code, jug1_capacity, jug2_capacity, successor_codes)
+        for move in range(6):
+            next_code = successor_codes[move]
+            if visited[next_code] == 0:
+                visited[next_code] = 1
+                parent_code[next_code] = code
+                parent_move[next_code] = move
+                queue[tail] = next_code
+                tail += 1
+
+    return -1, parent_code, parent_move
+
+if njit is not None:
+    _bfs_parents = njit(cache=True)(_bfs_parents)
 
 def water_jug_solver(jug1_capacity, jug2_capacity, target_amount):
-    """Solves the Water Jug problem using BFS."""
-    q = deque()
-    visited = set()
-    initial_state = (0, 0)
-    q.append((initial_state, []))
-    visited.add(initial_state)
-
-    while q:
-        (current_jug1, current_jug2), path = q.popleft()
-        if current_jug1 == target_amount or current_jug2 == target_amount:
-            path.append((current_jug1, current_jug2))
-            return path
-        next_states = []
-        next_states.append(((jug1_capacity, current_jug2), "Fill Jug1"))
-        next_states.append(((current_jug1, jug2_capacity), "Fill Jug2"))
-        next_states.append(((0, current_jug2), "Empty Jug1"))
-        next_states.append(((current_jug1, 0), "Empty Jug2"))
-        pour_amount = min(current_jug1, jug2_capacity - current_jug2)
-        next_states.append(((current_jug1 - pour_amount, current_jug2 + pour_amount), "Pour Jug1 to Jug2"))
-        pour_amount = min(current_jug2, jug1_capacity - current_jug1)
-        next_states.append(((current_jug1 + pour_amount, current_jug2 - pour_amount), "Pour Jug2 to Jug1"))
-
-        for (state, action_description) in next_states:
-            if state not in visited:
-                new_path = path + [(current_jug1, current_jug2), action_description]
-                q.append((state, new_path))
-                visited.add(state)
-
-    return None 
+    """Solves the Water Jug problem using BFS.
+
+    The search itself runs in `_bfs_parents` over packed int codes; this
+    wrapper only decodes the winning parent chain back into the
+    [state, action, state, ..., goal_state] layout the callers consume.
+    """
+    goal_code, parent_code, parent_move = _bfs_parents(
+        jug1_capacity, jug2_capacity, target_amount)
+    if goal_code < 0:
+        return None
+
+    width = jug2_capacity + 1
+    code = int(goal_code)
+    path = [divmod(code, width)]
+    while parent_code[code] != -1:
+        path.append(ACTIONS[parent_move[code]])
+        code = int(parent_code[code])
+        path.append(divmod(code, width))
+    path.reverse()
+    return path
 
 if __name__ == "__main__":
     jug1_cap = 4
@@ -43,17 +134,22 @@ if __name__ == "__main__":
         print("Solution found!")
         print("Initial state: (0, 0)")
         current_state = (0,0)
+        # Buffer the step listing and emit it with one print: one write
+        # syscall instead of one per step.
+        step_lines = []
         for i in range(0, len(solution_path) -1 , 2):
             action = solution_path[i+1]
             next_state = solution_path[i+2] if i+2 < len(solution_path) else solution_path[-1]
-            if isinstance(next_state, str): 
+            if isinstance(next_state, str):
                 next_state = solution_path[-1]
 
-            print(f"Step: {action} -> State: {next_state}")
+            step_lines.append(f"Step: {action} -> State: {next_state}")
             current_state = next_state
+        if VERBOSE and step_lines:
+            print("\n".join(step_lines))
         if current_state[0] != target and current_state[1] != target:
-          
-             pass 
+
+             pass
 
     else:
         print("No solution found.")
@@ -67,10 +163,11 @@ if __name__ == "__main__":
         print("Solution found!")
         current_state = (0,0)
         print("Initial state: (0, 0)")
-        for i in range(0, len(solution_path_2) -1 , 2):
-            action = solution_path_2[i+1]
-            next_state = solution_path_2[i+2] if i+2 < len(solution_path_2) else solution_path_2[-1]
-            print(f"Step: {action} -> State: {next_state}")
+        step_lines = [f"Step: {solution_path_2[i+1]} -> State: "
+                      f"{solution_path_2[i+2] if i+2 < len(solution_path_2) else solution_path_2[-1]}"
+                      for i in range(0, len(solution_path_2) -1 , 2)]
+        if VERBOSE and step_lines:
+            print("\n".join(step_lines))
     else:
         print("No solution found. (Target is odd, capacities are even)")
 
@@ -83,10 +180,11 @@ if __name__ == "__main__":
         print("Solution found!")
         current_state = (0,0)
         print("Initial state: (0, 0)")
-        for i in range(0, len(solution_path_3) -1 , 2):
-            action = solution_path_3[i+1]
-            next_state = solution_path_3[i+2] if i+2 < len(solution_path_3) else solution_path_3[-1]
-            print(f"Step: {action} -> State: {next_state}")
+        step_lines = [f"Step: {solution_path_3[i+1]} -> State: "
+                      f"{solution_path_3[i+2] if i+2 < len(solution_path_3) else solution_path_3[-1]}"
+                      for i in range(0, len(solution_path_3) -1 , 2)]
+        if VERBOSE and step_lines:
+            print("\n".join(step_lines))
     else:
         print("No solution found.")
 